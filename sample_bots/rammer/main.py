@@ -14,22 +14,26 @@ class RammerBot(Bot):
 
     async def run(self) -> None:
         self.set_turn_radar_right(360)
-        while self.is_running():
-            self.set_forward(400)
-            self.set_turn_right(20)
-            await self.go()
+        # Bind per-tick calls once so the loop body skips repeated attribute lookups.
+        is_running, set_forward, set_turn_right, go = self.is_running, self.set_forward, self.set_turn_right, self.go
+        while is_running():
+            set_forward(400)
+            set_turn_right(20)
+            await go()
 
     async def on_scanned_bot(self, e: ScannedBotEvent) -> None:
         # Close in and fire bigger shots as we approach.
-        bearing = self.gun_bearing_to(e.x, e.y)
+        direction = self.direction_to(e.x, e.y)
+        bearing = self.calc_gun_bearing(direction)
+        raw_distance = self.distance_to(e.x, e.y)
         self.set_turn_gun_right(bearing)
         if self.get_gun_heat() == 0:
-            distance = max(1.0, self.distance_to(e.x, e.y))
+            distance = max(1.0, raw_distance)
             power = max(0.5, min(3.0, 3.0 - (distance / 400)))
             self.set_fire(power)
-        body_bearing = self.bearing_to(e.x, e.y)
+        body_bearing = self.calc_bearing(direction)
         self.set_turn_right(body_bearing)
-        self.set_forward(max(50, self.distance_to(e.x, e.y) - 40))
+        self.set_forward(max(50, raw_distance - 40))
 
     async def on_hit_wall(self, e: HitWallEvent) -> None:
         self.set_turn_right(90)
@@ -8,7 +8,7 @@ from robocode_tank_royale.bot_api.bot_info import BotInfo
 from robocode_tank_royale.bot_api.events import HitByBulletEvent, HitWallEvent, ScannedBotEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class Target:
     x: float
     y: float
@@ -30,10 +30,12 @@ class SeriousStriker(Bot):
     async def run(self) -> None:
         # Continuous radar sweep to avoid losing track of bots.
         self.set_turn_radar_right(360)
-        while self.is_running():
-            self._patrol()
-            self._maybe_fire_last_seen()
-            await self.go()
+        # Bind per-tick calls once so the loop body skips repeated attribute lookups.
+        is_running, patrol, maybe_fire, go = self.is_running, self._patrol, self._maybe_fire_last_seen, self.go
+        while is_running():
+            patrol()
+            maybe_fire()
+            await go()
 
     def _patrol(self) -> None:
         # Wall avoidance: nudge inward when approaching edges.
@@ -64,19 +66,26 @@ class SeriousStriker(Bot):
             self.set_fire(firepower)
 
     async def on_scanned_bot(self, e: ScannedBotEvent) -> None:
-        self._last_target = Target(x=e.x, y=e.y, energy=e.energy, turn_seen=e.turn_number)
+        # Update the tracked target in place; a new one is only allocated after it ages out.
+        target = self._last_target
+        if target is None:
+            self._last_target = Target(x=e.x, y=e.y, energy=e.energy, turn_seen=e.turn_number)
+        else:
+            target.x, target.y, target.energy, target.turn_seen = e.x, e.y, e.energy, e.turn_number
+        # One atan2 for the enemy direction; body, radar and gun bearings derive from it.
+        direction = self.direction_to(e.x, e.y)
         # Strafe perpendicular to enemy bearing.
-        perp = self.bearing_to(e.x, e.y) + 90 * self._move_dir
+        perp = self.calc_bearing(direction) + 90 * self._move_dir
         self.set_turn_right(perp)
         self.set_forward(120 * self._move_dir)
-        self.set_turn_radar_right(self.calc_delta_angle(self.get_radar_direction(), self.direction_to(e.x, e.y)))
+        self.set_turn_radar_right(self.calc_delta_angle(self.get_radar_direction(), direction))
         # Fire immediately on scan event.
         if self.get_gun_heat() == 0:
             dist = max(1.0, self.distance_to(e.x, e.y))
             firepower = max(0.7, min(2.8, 450 / dist))
             if self.get_energy() < 20:
                 firepower = min(firepower, 1.2)
-            self.set_turn_gun_right(self.gun_bearing_to(e.x, e.y))
+            self.set_turn_gun_right(self.calc_gun_bearing(direction))
             self.set_fire(firepower)
 
     async def on_hit_by_bullet(self, e: HitByBulletEvent) -> None:
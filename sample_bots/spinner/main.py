@@ -15,14 +15,23 @@ class SpinnerBot(Bot):
 
     async def run(self) -> None:
         self.set_turn_radar_right(360)
-        while self.is_running():
+        # Bind per-tick calls once so the loop body skips repeated attribute lookups.
+        is_running, go = self.is_running, self.go
+        set_turn_right, set_turn_gun_left, set_forward, set_fire = (
+            self.set_turn_right,
+            self.set_turn_gun_left,
+            self.set_forward,
+            self.set_fire,
+        )
+        get_gun_heat, get_energy = self.get_gun_heat, self.get_energy
+        while is_running():
             # Slow circular strafe with continuous radar spin.
-            self.set_turn_right(15)
-            self.set_turn_gun_left(20)
-            self.set_forward(120)
-            if self.get_gun_heat() == 0 and self.get_energy() > 1:
-                self.set_fire(1.5)
-            await self.go()
+            set_turn_right(15)
+            set_turn_gun_left(20)
+            set_forward(120)
+            if get_gun_heat() == 0 and get_energy() > 1:
+                set_fire(1.5)
+            await go()
 
     async def on_scanned_bot(self, e: ScannedBotEvent) -> None:
         bearing = self.gun_bearing_to(e.x, e.y)
@@ -8,4 +8,5 @@ __all__ = [
     "tankroyale",
     "baselines",
     "artifacts",
+    "jsonio",
 ]
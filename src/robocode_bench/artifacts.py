@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
+import os
 import pathlib
 import shutil
-from typing import Dict, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Tuple
 
-from .config import BenchmarkConfig
+from . import jsonio
+from .config import load_config_cached
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs/xfs reflinks)
+_IGNORED_NAMES = frozenset({"__pycache__"})
+_IGNORED_SUFFIXES = (".pyc", ".pyo")
 
 
 class ArtifactError(Exception):
@@ -14,50 +27,132 @@ class ArtifactError(Exception):
 
 
 def _sha256_file(path: pathlib.Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
+    st = path.stat()
+    return _sha256_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _sha256_file_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns/size are only part of the cache key; a changed file misses the cache.
+    with open(path_str, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(262144), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
 
-def _iter_files(root: pathlib.Path) -> Iterable[pathlib.Path]:
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        if "__pycache__" in path.parts:
-            continue
-        if path.suffix in {".pyc", ".pyo"}:
+def _scan_files(root: str) -> Iterator[os.DirEntry]:
+    # Sorting each directory by name while descending depth-first matches sorted(rglob("*")).
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.name in _IGNORED_NAMES:
             continue
-        yield path
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_files(entry.path)
+        elif entry.is_file() and not entry.name.endswith(_IGNORED_SUFFIXES):
+            yield entry
+
+
+def _ignore_build_outputs(_dir: str, names: list[str]) -> list[str]:
+    """copytree ignore hook matching _scan_files (equivalent to ignore_patterns("__pycache__", "*.pyc", "*.pyo"))."""
+    return [n for n in names if n in _IGNORED_NAMES or n.endswith(_IGNORED_SUFFIXES)]
+
+
+def directory_fingerprint(root: pathlib.Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Sorted (relative path, mtime_ns, size) for each file under root, skipping build outputs; a cheap change check."""
+    entries = []
+    prefix = len(str(root)) + 1
+    for entry in _scan_files(str(root)):
+        st = entry.stat()
+        entries.append((entry.path[prefix:].replace(os.sep, "/"), st.st_mtime_ns, st.st_size))
+    return tuple(entries)
 
 
 def sha256_directory(root: pathlib.Path) -> str:
     """Hash file names + contents under a directory for reproducibility."""
     if not root.is_dir():
         raise ArtifactError(f"Directory not found: {root}")
+    return _sha256_directory_cached(str(root), directory_fingerprint(root))
+
+
+@functools.lru_cache(maxsize=128)
+def _sha256_directory_cached(root_str: str, fingerprint: Tuple[Tuple[str, int, int], ...]) -> str:
+    # The stat fingerprint keys the cache so edits, additions or removals force a rehash.
+    root = pathlib.Path(root_str)
+    rels = [rel for rel, _mtime_ns, _size in fingerprint]
     digest = hashlib.sha256()
-    for path in _iter_files(root):
-        rel = path.relative_to(root).as_posix()
-        digest.update(rel.encode("utf-8"))
-        digest.update(b"\0")
-        with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(8192), b""):
-                digest.update(chunk)
+    # Reads overlap across threads; map() keeps sorted order so the digest matches a serial walk.
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+        for rel, data in zip(rels, pool.map(lambda r: (root / r).read_bytes(), rels)):
+            digest.update(rel.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(data)
     return digest.hexdigest()
 
 
-def _collect_hashes(root: pathlib.Path, items: Sequence[pathlib.Path]) -> Dict[str, str]:
-    files: Dict[str, str] = {}
-    for path in items:
-        if path.is_file():
-            rel = path.relative_to(root).as_posix()
-            files[rel] = _sha256_file(path)
-            continue
-        for file_path in _iter_files(path):
-            rel = file_path.relative_to(root).as_posix()
-            files[rel] = _sha256_file(file_path)
-    return files
+def clone_file(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy `size` bytes between open fds in the kernel (FICLONE reflink, then copy_file_range).
+
+    Returns False when neither is available, leaving the caller to copy in userspace.
+    """
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return remaining == 0
+        except OSError:
+            pass
+    return False
+
+
+def _copy_and_hash(src: str, dst: str, use_hardlinks: bool = False) -> str:
+    """Copy src to dst (link, reflink or streamed copy) and return the sha256 of its contents."""
+    if use_hardlinks:
+        try:
+            os.link(src, dst)
+            return _sha256_file(pathlib.Path(src))
+        except OSError:  # cross-device or unsupported filesystem
+            pass
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if clone_file(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size):
+            digest = None
+        else:
+            # A partial copy_file_range may have moved both offsets; restart from scratch.
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            hasher = hashlib.sha256()
+            buf = bytearray(262144)
+            view = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+                fdst.write(view[:n])
+            digest = hasher.hexdigest()
+    shutil.copystat(src, dst)
+    # Cloned data never passed through userspace; hash the (possibly cached) source.
+    return digest or _sha256_file(pathlib.Path(src))
+
+
+def _absolute(path: pathlib.Path) -> pathlib.Path:
+    # Only relative inputs pay for resolve()'s symlink walk; absolute ones are taken as given.
+    path = pathlib.Path(path)
+    return path if path.is_absolute() else path.resolve()
 
 
 def save_workspace_artifact(
@@ -69,13 +164,18 @@ def save_workspace_artifact(
     benchmark_config: pathlib.Path,
     template_dir: pathlib.Path,
     force: bool = False,
+    use_hardlinks: bool = False,
 ) -> pathlib.Path:
     """
     Copy curated files from a workspace into bots/<model>/<variant>/ with metadata.
 
+    Files are reflinked where the filesystem supports it. With use_hardlinks the
+    artifact shares inodes with the workspace, so later in-place edits to the
+    workspace would also change the artifact.
+
     Returns the destination path.
     """
-    ws_root = workspace.resolve()
+    ws_root = _absolute(workspace)
     prompts_dir = ws_root / "prompts"
     bot_dir = ws_root / "bot"
     bot_src = bot_dir / "src"
@@ -90,14 +190,14 @@ def save_workspace_artifact(
     if missing:
         raise ArtifactError(f"Missing required workspace files: {', '.join(missing)}")
 
-    cfg_path = pathlib.Path(benchmark_config).resolve()
+    cfg_path = _absolute(benchmark_config)
     if not cfg_path.exists():
         raise ArtifactError(f"Benchmark config not found: {cfg_path}")
-    template_path = pathlib.Path(template_dir).resolve()
+    template_path = _absolute(template_dir)
     if not template_path.exists():
         raise ArtifactError(f"Template directory not found: {template_path}")
 
-    dest = pathlib.Path(dest_root).resolve() / model_id / variant_id
+    dest = _absolute(dest_root) / model_id / variant_id
     if dest.exists():
         if not force:
             raise ArtifactError(f"Destination already exists: {dest}")
@@ -109,12 +209,25 @@ def save_workspace_artifact(
     dest_bot.mkdir(parents=True, exist_ok=True)
     dest_prompts.mkdir(parents=True, exist_ok=True)
 
-    shutil.copy2(bot_config, dest_bot / "bot-config.json")
-    shutil.copytree(bot_src, dest_bot / "src", dirs_exist_ok=True, ignore=shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo"))
-    shutil.copy2(prompts_dir / "initial_prompt.txt", dest_prompts / "initial_prompt.txt")
-    shutil.copy2(prompts_dir / "initial_response.txt", dest_prompts / "initial_response.txt")
+    files: Dict[str, str] = {}
+    prefix = len(str(dest)) + 1
+
+    def copy_file(src: str, dst: str) -> str:
+        files[dst[prefix:].replace(os.sep, "/")] = _copy_and_hash(src, dst, use_hardlinks)
+        return dst
 
-    cfg = BenchmarkConfig.load(cfg_path)
+    copy_file(str(bot_config), str(dest_bot / "bot-config.json"))
+    shutil.copytree(
+        bot_src,
+        dest_bot / "src",
+        dirs_exist_ok=True,
+        ignore=_ignore_build_outputs,
+        copy_function=copy_file,
+    )
+    copy_file(str(prompts_dir / "initial_prompt.txt"), str(dest_prompts / "initial_prompt.txt"))
+    copy_file(str(prompts_dir / "initial_response.txt"), str(dest_prompts / "initial_response.txt"))
+
+    cfg = load_config_cached(cfg_path)
     metadata = {
         "model_id": model_id,
         "variant_id": variant_id,
@@ -122,8 +235,8 @@ def save_workspace_artifact(
         "benchmark_config_sha256": _sha256_file(cfg_path),
         "template_sha256": sha256_directory(template_path),
         "seeds": cfg.seeds,
-        "files": _collect_hashes(dest, [dest_bot, dest_prompts]),
+        "files": dict(sorted(files.items(), key=lambda item: item[0].split("/"))),
     }
     metadata_path = dest / "metadata.json"
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    metadata_path.write_bytes(jsonio.dumps_bytes(metadata, indent=True))
     return dest
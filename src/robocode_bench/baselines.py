@@ -4,7 +4,7 @@ import pathlib
 from dataclasses import dataclass
 from typing import List
 
-import yaml
+from .config import load_yaml
 
 
 @dataclass
@@ -37,7 +37,7 @@ def load_manifest(
     if not path.is_absolute() and root:
         path = root / path
     path = path.resolve()
-    data = yaml.safe_load(path.read_text())
+    data = load_yaml(path)
     base_dir = root or path.parent.parent  # repo root if manifest is under baselines/
     bots: List[BaselineBot] = []
     for entry in data.get("bots", []):
@@ -0,0 +1,102 @@
+"""
+Per-bot supervisor: import the bot framework once, then fork a fresh bot per match.
+
+Run as `python bot_supervisor.py <entry> <reply_fd>` with cwd set to the
+bot directory; reply_fd is an AF_UNIX SOCK_SEQPACKET socket. Each stdin line is a JSON
+command `{"cmd": "start", "port": N}`; the supervisor forks, the child runs `<entry>` as
+__main__ against ws://localhost:N, and the reply is one packet `{"pid": P}` carrying a pidfd
+for the child (or `{"error": ...}` without one). EOF on stdin shuts it down.
+Linux only (os.fork + os.pidfd_open). Stdlib-only and run by path, so the bot's import
+environment is the same as under `python <entry>`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import runpy
+import signal
+import socket
+import sys
+import traceback
+
+
+def _preload() -> None:
+    # The framework import is the bulk of a bot's start-up cost; bots that cannot import
+    # it fail the same way once their child runs.
+    try:
+        import robocode_tank_royale.bot_api.bot  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _run_child(entry: str, port: int, reply_fd: int) -> None:
+    os.close(reply_fd)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.environ.setdefault("SERVER_URL", f"ws://localhost:{port}")
+    # Match `python <entry>`: argv and sys.path[0] point at the script.
+    sys.argv = [entry]
+    sys.path[0] = os.path.dirname(os.path.abspath(entry))
+    code = 0
+    try:
+        runpy.run_path(entry, run_name="__main__")
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _reap() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _reply(sock: socket.socket, pid: int) -> None:
+    # Until it is reaped, an exited child stays a zombie and its pid cannot be reused, so
+    # the pidfd opened here always refers to this child.
+    try:
+        pidfd = os.pidfd_open(pid)
+    except OSError as exc:
+        os.kill(pid, signal.SIGKILL)
+        sock.send(json.dumps({"error": f"pidfd_open failed: {exc}"}).encode())
+        return
+    try:
+        socket.send_fds(sock, [json.dumps({"pid": pid}).encode()], [pidfd])
+    finally:
+        os.close(pidfd)
+
+
+def main(argv: list[str]) -> int:
+    entry, reply_fd = argv[0], int(argv[1])
+    _preload()
+    sock = socket.socket(fileno=reply_fd)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        cmd = json.loads(line)
+        if cmd.get("cmd") != "start":
+            continue
+        pid = os.fork()
+        if pid == 0:
+            _run_child(entry, int(cmd["port"]), reply_fd)
+        _reply(sock, pid)
+        # Every child forked so far has had its pidfd handed over; exited ones can go.
+        _reap()
+    _reap()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
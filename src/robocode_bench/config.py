@@ -1,13 +1,55 @@
 from __future__ import annotations
 
+import copy
+import functools
+import os
 import pathlib
 import json
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
-import yaml
 from pydantic import BaseModel, Field, validator
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # Imported on first parse so importing the models alone doesn't pay for PyYAML.
+    import yaml
+
+    # libyaml's C loader is ~10x faster; fall back when PyYAML was built without it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=loader)
+
+
+def load_yaml(path: str | pathlib.Path) -> Any:
+    """Parse a YAML file, reusing the previous parse while its mtime/size are unchanged."""
+    path_str = os.path.abspath(path)
+    st = os.stat(path_str)
+    # Callers mutate the result (defaults, key renames), so hand out a private copy.
+    return copy.deepcopy(_parse_yaml_cached(path_str, st.st_mtime_ns, st.st_size))
+
+
+def _seeds_file(cfg_path: pathlib.Path, data: dict) -> Optional[pathlib.Path]:
+    """Seeds file a config falls back to when it has no inline seeds."""
+    if data.get("seeds"):
+        return None
+    seeds_path = data.get("battle_files", {}).get("seeds_path")
+    if not seeds_path:
+        return None
+    spath = pathlib.Path(seeds_path)
+    return spath if spath.is_absolute() else cfg_path.parent / spath
+
+
+def _stat_key(path: Optional[pathlib.Path]) -> Optional[Tuple[int, int]]:
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class GenerationLimits(BaseModel):
     max_input_tokens: int = Field(..., description="Max prompt tokens")
     max_output_tokens: int = Field(..., description="Max model output tokens")
@@ -58,19 +100,13 @@ class BenchmarkConfig(BaseModel):
     @classmethod
     def load(cls, path: str | pathlib.Path) -> "BenchmarkConfig":
         cfg_path = pathlib.Path(path)
-        with cfg_path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+        data = load_yaml(cfg_path)
         data.setdefault("seeds", [])
-        if not data.get("seeds"):
-            seeds_path = data.get("battle_files", {}).get("seeds_path")
-            if seeds_path:
-                spath = pathlib.Path(seeds_path)
-                if not spath.is_absolute():
-                    spath = cfg_path.parent / spath
-                if spath.exists():
-                    loaded = json.loads(spath.read_text())
-                    if isinstance(loaded, list):
-                        data["seeds"] = loaded
+        spath = _seeds_file(cfg_path, data)
+        if spath and spath.exists():
+            loaded = json.loads(spath.read_text())
+            if isinstance(loaded, list):
+                data["seeds"] = loaded
         # Backward compatibility: rename attempt_policy -> variant_policy
         if "attempt_policy" in data and "variant_policy" not in data:
             data["variant_policy"] = data.pop("attempt_policy")
@@ -83,11 +119,29 @@ class BenchmarkConfig(BaseModel):
     def ensure_paths(self, root: Optional[pathlib.Path] = None) -> "BenchmarkConfig":
         """Return a copy with paths resolved relative to root if provided."""
         root = root or pathlib.Path.cwd()
-        data = self.dict()
-        battle = data.get("battle_files", {})
-        if "battle_config_path" in battle:
-            battle["battle_config_path"] = str((root / battle["battle_config_path"]).resolve())
-        if "seeds_path" in battle:
-            battle["seeds_path"] = str((root / battle["seeds_path"]).resolve())
-        data["battle_files"] = battle
-        return BenchmarkConfig(**data)
+        # model_copy skips re-validation; the fields are already Paths, so only the two values change.
+        battle = self.battle_files.model_copy(
+            update={
+                "battle_config_path": (root / self.battle_files.battle_config_path).resolve(),
+                "seeds_path": (root / self.battle_files.seeds_path).resolve(),
+            }
+        )
+        return self.model_copy(update={"battle_files": battle})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int, seeds_key: Optional[Tuple[int, int]]) -> BenchmarkConfig:
+    return BenchmarkConfig.load(path_str)
+
+
+def load_config_cached(path: str | pathlib.Path) -> BenchmarkConfig:
+    """
+    BenchmarkConfig.load memoized on the config file and its seeds file versions.
+
+    The returned instance is shared between callers; treat it as read-only.
+    """
+    path_str = os.path.abspath(path)
+    st = os.stat(path_str)
+    data = _parse_yaml_cached(path_str, st.st_mtime_ns, st.st_size)
+    seeds_key = _stat_key(_seeds_file(pathlib.Path(path_str), data))
+    return _load_config_cached(path_str, st.st_mtime_ns, st.st_size, seeds_key)
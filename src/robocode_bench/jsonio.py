@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when installed and fall back to the stdlib."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps the toolkit usable without the C extension
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type either way.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes (bytes skip a decode step under orjson)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes; indent=True matches json.dumps(indent=2) layout."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to str, e.g. for WebSocket text frames."""
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
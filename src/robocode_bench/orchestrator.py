@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import functools
+import multiprocessing
 import os
 import pathlib
+import py_compile
+import select
+import shutil
 import signal
 import subprocess
 import sys
 import socket
-from typing import Dict, List, Optional, Sequence
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence
 
 import typer
 from rich import print
 
-from .config import BenchmarkConfig
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio loop works the same, just slower per await
+    uvloop = None  # type: ignore[assignment]
+
+from . import jsonio
+from .config import BenchmarkConfig, load_config_cached
 from .workspace import WorkspaceManager, WorkspacePaths
 from .artifacts import save_workspace_artifact, ArtifactError
 from . import tankroyale
@@ -32,29 +47,92 @@ from .baselines import load_manifest
 
 app = typer.Typer(add_completion=False, help="Tank Royale benchmark orchestrator")
 
+# Warm interpreters for byte-compiling large bot trees; created on first use and reused
+# across builds in the same process. Small trees compile in-process (see _run_py_compile).
+_compile_pool: Optional[ProcessPoolExecutor] = None
+_compile_pool_lock = threading.Lock()
+_POOL_MIN_FILES = 32
+
 
 def _load_config(path: pathlib.Path) -> BenchmarkConfig:
-    return BenchmarkConfig.load(path)
+    # Shared instance, re-read only when the config or its seeds file changes.
+    return load_config_cached(path)
 
 
 def _copy_battle_config(cfg: BenchmarkConfig, dest_dir: pathlib.Path) -> pathlib.Path:
     dest_dir.mkdir(parents=True, exist_ok=True)
+    # copyfile stays in the kernel (copy_file_range/sendfile) instead of decoding and re-encoding.
     src = pathlib.Path(cfg.battle_files.battle_config_path)
     dest = dest_dir / src.name
-    data = src.read_text(encoding="utf-8")
-    dest.write_text(data, encoding="utf-8")
+    shutil.copyfile(src, dest)
     seeds_src = pathlib.Path(cfg.battle_files.seeds_path)
-    seeds_dest = dest_dir / seeds_src.name
-    seeds_dest.write_text(seeds_src.read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(seeds_src, dest_dir / seeds_src.name)
     return dest
 
 
+def _get_compile_pool() -> ProcessPoolExecutor:
+    global _compile_pool
+    # Builds can run from several threads (run_sanity_check --check all); create one pool.
+    with _compile_pool_lock:
+        if _compile_pool is None:
+            # Never fork workers from a process that may already be running threads.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _compile_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method))
+        return _compile_pool
+
+
+def _compile_one(path: str) -> str:
+    """Byte-compile a single file; returns the error message, or "" on success."""
+    try:
+        py_compile.compile(path, doraise=True)
+    except py_compile.PyCompileError as exc:
+        return exc.msg
+    except OSError as exc:
+        return str(exc)
+    return ""
+
+
+def _walk_py(root: pathlib.Path) -> list[str]:
+    """List .py files under root as str paths; like rglob("*.py") without per-entry Path objects."""
+    out: list[str] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # rglob skips missing or unreadable directories too
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    out.append(entry.path)
+    return out
+
+
 def _run_py_compile(bot_src: pathlib.Path) -> subprocess.CompletedProcess:
-    py_files = [str(p) for p in bot_src.rglob("*.py")]
+    """Compile every .py under bot_src; the result mirrors `python -m py_compile` (exit code + stderr)."""
+    global _compile_pool
+    py_files = _walk_py(bot_src)
     if not py_files:
         raise FileNotFoundError(f"No Python sources found under {bot_src}")
-    cmd = ["python", "-m", "py_compile", *py_files]
-    return subprocess.run(cmd, capture_output=True, text=True)
+    if len(py_files) < _POOL_MIN_FILES:
+        # A handful of files compiles faster than worker start-up; py_compile wraps
+        # compiler exceptions in PyCompileError, so this stays safe in-process.
+        errors = [msg for msg in map(_compile_one, py_files) if msg]
+    else:
+        try:
+            errors = [msg for msg in _get_compile_pool().map(_compile_one, py_files, chunksize=8) if msg]
+        except BrokenProcessPool:
+            with _compile_pool_lock:
+                _compile_pool = None  # recreate on the next build
+            errors = ["py_compile worker process died while compiling bot sources"]
+    return subprocess.CompletedProcess(
+        args=["py_compile", *py_files],
+        returncode=1 if errors else 0,
+        stdout="",
+        stderr="\n".join(errors),
+    )
 
 
 def _workspace_paths(workspace: pathlib.Path) -> WorkspacePaths:
@@ -99,9 +177,47 @@ def _find_free_port(preferred: int = tankroyale.DEFAULT_PORT) -> int:
             return s.getsockname()[1]
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_battle_config(path_str: str, mtime_ns: int, size: int) -> dict:
+    return jsonio.loads(pathlib.Path(path_str).read_bytes())
+
+
+def _reserve_ports(count: int) -> list[int]:
+    """Return `count` distinct OS-assigned ports (all sockets are bound at once, then closed)."""
+    socks: list[socket.socket] = []
+    try:
+        for _ in range(count):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            socks.append(s)
+            s.bind(("", 0))
+        return [s.getsockname()[1] for s in socks]
+    finally:
+        for s in socks:
+            s.close()
+
+
 def _load_battle_config(cfg: BenchmarkConfig) -> dict:
-    path = pathlib.Path(cfg.battle_files.battle_config_path)
-    return json.loads(path.read_text())
+    """Parsed battle config, cached per file version; callers share the dict and must not mutate it."""
+    path_str = os.path.abspath(cfg.battle_files.battle_config_path)
+    st = os.stat(path_str)
+    return _parse_battle_config(path_str, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _bot_name_cached(bot_dir_str: str) -> str:
+    bot_dir = pathlib.Path(bot_dir_str)
+    cfg_path = bot_dir / "bot-config.json"
+    if cfg_path.exists():
+        try:
+            return jsonio.loads(cfg_path.read_bytes()).get("name", bot_dir.name)
+        except Exception:
+            return bot_dir.name
+    return bot_dir.name
+
+
+def _bot_name(bot_dir: pathlib.Path) -> str:
+    """Lobby name from bot-config.json (falls back to the directory name); parsed once per directory."""
+    return _bot_name_cached(os.path.abspath(bot_dir))
 
 
 def _battle_setup_from_config(battle_config: dict, game_type: str, participants: int) -> dict:
@@ -130,10 +246,7 @@ def _battle_setup_from_config(battle_config: dict, game_type: str, participants:
     }
 
 
-def _launch_python_bot(bot_dir: pathlib.Path, port: int) -> subprocess.Popen:
-    env = os.environ.copy()
-    env.setdefault("SERVER_URL", f"ws://localhost:{port}")
-    env.setdefault("PYTHONPATH", os.pathsep.join([env.get("PYTHONPATH", ""), str(pathlib.Path(__file__).resolve().parents[2] / "src")]).strip(os.pathsep))
+def _bot_entry(bot_dir: pathlib.Path) -> str:
     main_path = bot_dir / "main.py"
     if not main_path.exists():
         nested = bot_dir / "src" / "main.py"
@@ -141,24 +254,214 @@ def _launch_python_bot(bot_dir: pathlib.Path, port: int) -> subprocess.Popen:
             main_path = nested
     if not main_path.exists():
         raise FileNotFoundError(f"Cannot find main.py under {bot_dir}")
-    cwd = bot_dir
     if main_path.parent != bot_dir:
         try:
             rel = main_path.relative_to(bot_dir)
         except ValueError:
             rel = main_path.name
-        entry = str(rel)
-    else:
-        entry = main_path.name
-    return subprocess.Popen([sys.executable, entry], cwd=cwd, env=env)
+        return str(rel)
+    return main_path.name
+
+
+_SRC_ROOT = str(pathlib.Path(__file__).resolve().parents[2] / "src")
+
+
+@functools.lru_cache(maxsize=1)
+def _base_bot_env() -> dict[str, str]:
+    # Snapshot of the environment on first launch; callers must not mutate it.
+    env = os.environ.copy()
+    env.setdefault("PYTHONPATH", _SRC_ROOT)
+    return env
+
+
+def _bot_env(**extra: str) -> dict[str, str]:
+    """Environment for bot processes; `extra` entries apply only where the variable is unset."""
+    base = _base_bot_env()
+    return {**base, **{k: v for k, v in extra.items() if k not in base}}
+
+
+class _SupervisedBot:
+    """
+    Popen-like handle (poll/wait/send_signal) for a bot forked by a bot_supervisor process.
+
+    The bot is tracked through a pidfd, which keeps referring to that process after it
+    exits, so a recycled pid is never mistaken for it or signalled. The exit status belongs
+    to the supervisor, so returncode is reported as 0 once the bot has exited.
+    """
+
+    def __init__(self, pid: int, pidfd: int) -> None:
+        self.pid = pid
+        self.returncode: Optional[int] = None
+        self._pidfd = pidfd
+
+    def __del__(self) -> None:
+        if self._pidfd >= 0:
+            os.close(self._pidfd)
+            self._pidfd = -1
+
+    def _exited(self, timeout: Optional[float]) -> bool:
+        poller = select.poll()
+        poller.register(self._pidfd, select.POLLIN)
+        return bool(poller.poll(None if timeout is None else int(max(0.0, timeout) * 1000)))
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None and self._exited(0):
+            self.returncode = 0
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None:
+            if not self._exited(timeout):
+                raise subprocess.TimeoutExpired(f"bot pid {self.pid}", timeout)
+            self.returncode = 0
+        return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.returncode is None:
+            try:
+                signal.pidfd_send_signal(self._pidfd, sig)
+            except ProcessLookupError:
+                pass
+
+
+# Bound on the supervisor's reply to a start command; it replies right after fork, but the
+# first command also waits for the framework preload.
+_SUPERVISOR_REPLY_TIMEOUT = 30.0
+
+# One supervisor per bot directory: (process, reply socket, lock for its start/reply
+# exchange), kept for the life of the run.
+_supervisors: dict[pathlib.Path, tuple[subprocess.Popen, socket.socket, threading.Lock]] = {}
+# Guards the _supervisors dict only; each exchange holds just its own supervisor's lock, so
+# threads never interleave on one supervisor and a stuck one cannot stall the others.
+_supervisors_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _supervisor_supported() -> bool:
+    """Forked bots are tracked by pidfd (Linux 5.3+); elsewhere each bot is spawned directly."""
+    if not (hasattr(os, "fork") and hasattr(os, "pidfd_open") and hasattr(socket, "recv_fds") and hasattr(signal, "pidfd_send_signal")):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
+
 
+def _discard_supervisor(sup: tuple[subprocess.Popen, socket.socket, threading.Lock]) -> None:
+    proc, sock, _ = sup
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+    proc.kill()
+    proc.wait()
+    sock.close()
+
+
+def _close_supervisors() -> None:
+    for proc, sock, _ in _supervisors.values():
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        sock.close()
+    _supervisors.clear()
+
+
+atexit.register(_close_supervisors)
+
+
+def _get_supervisor(bot_dir: pathlib.Path) -> tuple[subprocess.Popen, socket.socket, threading.Lock]:
+    """Running supervisor for bot_dir, replacing a dead one; call with _supervisors_lock held."""
+    key = bot_dir.resolve()
+    sup = _supervisors.get(key)
+    if sup is not None:
+        if sup[0].poll() is None:
+            return sup
+        _discard_supervisor(_supervisors.pop(key))
+    entry = _bot_entry(bot_dir)
+    # SEQPACKET keeps each reply (and the pidfd attached to it) in one message.
+    ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, str(pathlib.Path(__file__).with_name("bot_supervisor.py")), entry, str(theirs.fileno())],
+            cwd=bot_dir,
+            env=_base_bot_env(),
+            stdin=subprocess.PIPE,
+            pass_fds=(theirs.fileno(),),
+        )
+    except BaseException:
+        ours.close()
+        raise
+    finally:
+        theirs.close()
+    ours.settimeout(_SUPERVISOR_REPLY_TIMEOUT)
+    sup = (proc, ours, threading.Lock())
+    _supervisors[key] = sup
+    return sup
+
+
+def _launch_python_bot(bot_dir: pathlib.Path, port: int) -> subprocess.Popen | _SupervisedBot:
+    """
+    Start one bot process connected to the server on `port`.
+
+    On Linux the bot is forked from a long-lived per-directory supervisor that has already
+    imported the bot framework, which skips interpreter start-up for every match. If the
+    supervisor cannot be used (or does not reply in time), it is killed and the bot is
+    spawned directly.
+    """
+    if _supervisor_supported():
+        with _supervisors_lock:
+            sup = _get_supervisor(bot_dir)
+        proc, sock, lock = sup
+        with lock:
+            fds: list[int] = []
+            try:
+                proc.stdin.write(jsonio.dumps_bytes({"cmd": "start", "port": port}) + b"\n")
+                proc.stdin.flush()
+                msg, fds, _flags, _addr = socket.recv_fds(sock, 4096, 1)
+                if fds:
+                    return _SupervisedBot(int(jsonio.loads(msg)["pid"]), fds[0])
+            except (OSError, ValueError, KeyError):
+                for fd in fds:
+                    os.close(fd)
+            with _supervisors_lock:
+                key = bot_dir.resolve()
+                if _supervisors.get(key) is sup:
+                    del _supervisors[key]
+            _discard_supervisor(sup)
+    env = _bot_env(SERVER_URL=f"ws://localhost:{port}")
+    return subprocess.Popen([sys.executable, _bot_entry(bot_dir)], cwd=bot_dir, env=env)
+
+
+_GAME_ENDED = "GameEndedEventForObserver"
+_CONTROLLER_PHASES = 3
+_GAME_ENDED_B = _GAME_ENDED.encode()
+
+
+async def _controller_run(
+    expected_bots: Sequence[str],
+    game_setup: dict,
+    seed: int,
+    port: int,
+    recv_timeout: Optional[float] = None,
+) -> list[dict]:
+    """
+    Drive one game as controller and return the GameEnded results.
 
-async def _controller_run(expected_bots: Sequence[str], game_setup: dict, seed: int, port: int) -> list[dict]:
+    recv_timeout bounds the wait for each server message, so a stalled server fails the
+    match promptly; WebSocket pings catch connections that die silently.
+    """
     import websockets
 
+    async def recv():
+        return await asyncio.wait_for(ws.recv(), timeout=recv_timeout)
+
     url = f"ws://localhost:{port}"
-    async with websockets.connect(url) as ws:
-        msg = json.loads(await ws.recv())
+    async with websockets.connect(url, max_size=None, ping_interval=30) as ws:
+        msg = jsonio.loads(await recv())
         assert msg.get("type") == "ServerHandshake", f"Unexpected message: {msg}"
         server_session = msg["sessionId"]
         ctrl = {
@@ -168,65 +471,83 @@ async def _controller_run(expected_bots: Sequence[str], game_setup: dict, seed:
             "version": "0.1",
             "author": "bench",
         }
-        await ws.send(json.dumps(ctrl))
+        await ws.send(jsonio.dumps(ctrl))
 
+        # Only expected bots count towards the lobby; start as soon as all of them have joined.
+        expected_set = set(expected_bots)
         bots: dict[str, dict] = {}
-        while len(bots) < len(expected_bots):
-            payload = json.loads(await ws.recv())
+        while len(bots) < len(expected_set):
+            payload = jsonio.loads(await recv())
             if payload.get("type") == "BotListUpdate":
                 for bot in payload.get("bots", []):
-                    bots[bot["name"]] = bot
-        missing = [name for name in expected_bots if name not in bots]
-        if missing:
-            raise RuntimeError(f"Missing bots in lobby: {missing}")
-        addresses = [{"host": bots[name]["host"], "port": bots[name]["port"]} for name in expected_bots]
-        setup = dict(game_setup)
-        setup["seed"] = seed
+                    name = bot["name"]
+                    if name in expected_set and name not in bots:
+                        bots[name] = {"host": bot["host"], "port": bot["port"]}
+        addresses = [bots[name] for name in expected_bots]
         start_game = {
             "type": "StartGame",
             "botAddresses": addresses,
-            "gameSetup": setup,
+            "gameSetup": {**game_setup, "seed": seed},
         }
-        await ws.send(json.dumps(start_game))
+        await ws.send(jsonio.dumps(start_game))
 
         game_results: list[dict] | None = None
         while True:
             try:
-                payload = json.loads(await ws.recv())
+                frame = await recv()
             except websockets.ConnectionClosed:
                 break
-            if payload.get("type") == "GameEndedEventForObserver":
+            # Tick events arrive every turn; only decode frames that can be the game-end event.
+            if (_GAME_ENDED_B if isinstance(frame, bytes) else _GAME_ENDED) not in frame:
+                continue
+            payload = jsonio.loads(frame)
+            if payload.get("type") == _GAME_ENDED:
                 game_results = payload.get("results", [])
                 break
         return game_results or []
 
 
+# (RoundScore field, GameEnded result key) pairs averaged per round.
 def _results_to_roundscores(results: list[dict], participants: int, rounds: int) -> Dict[str, List[Dict]]:
     # Treat aggregate game results as a single pseudo-round averaged per round for scoring.
     scores: Dict[str, List[Dict]] = {}
     if not results:
         return scores
+    roundsafe = max(1, rounds)
     # Rank by totalScore descending.
     sorted_results = sorted(results, key=lambda r: r.get("totalScore", 0), reverse=True)
     for rank_idx, res in enumerate(sorted_results, start=1):
-        total = res.get("totalScore", 0.0)
-        roundsafe = max(1, rounds)
+        get = res.get
+        # Keep true division (not a reciprocal multiply) so scores stay bit-identical.
         entry = {
             "round_number": 1,
-            "total_score": total / roundsafe,
-            "bullet_damage": res.get("bulletDamage", 0.0) / roundsafe,
-            "bullet_damage_bonus": res.get("bulletDamageBonus", 0.0) / roundsafe,
-            "ram_damage": res.get("ramDamage", 0.0) / roundsafe,
-            "ram_damage_bonus": res.get("ramDamageBonus", 0.0) / roundsafe,
-            "survival_score": res.get("survival", 0.0) / roundsafe,
-            "last_survivor_bonus": res.get("lastSurvivorBonus", 0.0) / roundsafe,
+            "total_score": get("totalScore", 0.0) / roundsafe,
+            "bullet_damage": get("bulletDamage", 0.0) / roundsafe,
+            "bullet_damage_bonus": get("bulletDamageBonus", 0.0) / roundsafe,
+            "ram_damage": get("ramDamage", 0.0) / roundsafe,
+            "ram_damage_bonus": get("ramDamageBonus", 0.0) / roundsafe,
+            "survival_score": get("survival", 0.0) / roundsafe,
+            "last_survivor_bonus": get("lastSurvivorBonus", 0.0) / roundsafe,
             "rank": rank_idx,
         }
-        scores.setdefault(res.get("name", f"bot_{rank_idx}"), []).append(entry)
+        scores.setdefault(get("name", f"bot_{rank_idx}"), []).append(entry)
     return scores
 
 
-def _launch_battle(
+def _reap_bots(loops: Sequence[subprocess.Popen | _SupervisedBot], timeout: float = 10) -> None:
+    """Give all bots one shared `timeout` to exit after the game, then SIGTERM the rest."""
+    deadline = time.monotonic() + timeout
+    lingering = []
+    for proc in loops:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            lingering.append(proc)
+    for proc in lingering:
+        proc.send_signal(signal.SIGTERM)
+
+
+async def _launch_battle_async(
     server_jar: pathlib.Path,
     recorder_jar: Optional[pathlib.Path],
     expected: Sequence[str],
@@ -238,12 +559,19 @@ def _launch_battle(
     port: int = tankroyale.DEFAULT_PORT,
     java_bin: Optional[pathlib.Path] = None,
     timeout_seconds: int = 300,
+    match_id: Optional[str] = None,
 ) -> list[dict]:
-    """Start server/recorder, launch bots, run controller, and return game results."""
-    server_log = logs_dir / f"server_seed{seed}.log"
-    recorder_log = logs_dir / f"recorder_seed{seed}.log"
+    """
+    Start server/recorder, launch bots, run controller, and return game results.
+
+    Blocking waits (port probe, process shutdown) run in worker threads so several
+    matches can share one event loop. match_id names the log files (default: seed<N>).
+    """
+    tag = match_id or f"seed{seed}"
+    server_log = logs_dir / f"server_{tag}.log"
+    recorder_log = logs_dir / f"recorder_{tag}.log"
     logs_dir.mkdir(parents=True, exist_ok=True)
-    loops: list[subprocess.Popen] = []
+    loops: list[subprocess.Popen | _SupervisedBot] = []
     server = tankroyale.start_server(
         server_jar,
         server_log,
@@ -254,7 +582,7 @@ def _launch_battle(
     )
     recorder_proc: Optional[tankroyale.TankRoyaleProcess] = None
     try:
-        if not tankroyale.wait_for_port(port=port, timeout=10):
+        if not await asyncio.to_thread(tankroyale.wait_for_port, port=port, timeout=10):
             raise RuntimeError("Server WebSocket not ready in time")
         if recorder_jar:
             recorder_proc = tankroyale.start_recorder(
@@ -264,22 +592,84 @@ def _launch_battle(
                 output_dir=recorder_dir,
                 java_bin=java_bin,
             )
-        loops = [_launch_python_bot(p, port) for p in bot_dirs]
+        # A supervisor reply can take seconds (first framework preload), so launch off the loop.
+        loops = [await asyncio.to_thread(_launch_python_bot, p, port) for p in bot_dirs]
         results: list[dict] = []
         try:
             wait_timeout = max(30, timeout_seconds)
-            results = asyncio.run(asyncio.wait_for(_controller_run(expected, game_setup, seed, port), timeout=wait_timeout))
+            # Handshake, lobby and game each get a share of the budget per message.
+            recv_timeout = wait_timeout / _CONTROLLER_PHASES
+            results = await asyncio.wait_for(
+                _controller_run(expected, game_setup, seed, port, recv_timeout=recv_timeout),
+                timeout=wait_timeout,
+            )
         finally:
-            for proc in loops:
-                try:
-                    proc.wait(timeout=10)
-                except subprocess.TimeoutExpired:
-                    proc.send_signal(signal.SIGTERM)
+            await asyncio.to_thread(_reap_bots, loops)
         return results
     finally:
         if recorder_proc:
-            recorder_proc.stop()
-        server.stop()
+            await asyncio.to_thread(recorder_proc.stop)
+        await asyncio.to_thread(server.stop)
+
+
+def _run_async(coro):
+    """asyncio.run, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _launch_battle(*args, **kwargs) -> list[dict]:
+    """Run a single match to completion; see _launch_battle_async for arguments."""
+    return _run_async(_launch_battle_async(*args, **kwargs))
+
+
+async def _run_matches(
+    matches: Sequence[dict],
+    concurrency: int,
+    on_result: Optional[Callable[[int, list[dict]], None]] = None,
+    on_error: Optional[Callable[[int, Exception], None]] = None,
+) -> list[list[dict]]:
+    """
+    Run _launch_battle_async for each kwargs dict, at most `concurrency` at a time.
+
+    A pool of `concurrency` distinct ports doubles as the concurrency gate, so matches in
+    flight never share a port. Results come back in input order; on_result(index, results)
+    is also called as each match finishes. After the first failure (reported through
+    on_error(index, exc)) no further matches are started; the ones already in flight finish
+    and clean up their processes, then that failure is re-raised.
+    """
+    ports: asyncio.Queue[int] = asyncio.Queue()
+    for port in _reserve_ports(max(1, concurrency)):
+        ports.put_nowait(port)
+    failures: list[Exception] = []
+
+    async def _one(index: int, kwargs: dict) -> Optional[list[dict]]:
+        port = await ports.get()
+        if failures:
+            ports.put_nowait(port)
+            return None
+        try:
+            results = await _launch_battle_async(port=port, **kwargs)
+        except Exception as exc:
+            failures.append(exc)
+            if on_error is not None:
+                on_error(index, exc)
+            raise
+        finally:
+            # The stopped server may leave the port in TIME_WAIT; re-probe before reuse.
+            ports.put_nowait(_find_free_port(port))
+        if on_result is not None:
+            on_result(index, results)
+        return results
+
+    outcomes = await asyncio.gather(*(_one(i, m) for i, m in enumerate(matches)), return_exceptions=True)
+    if failures:
+        raise failures[0]
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return list(outcomes)
 
 
 @app.command()
@@ -336,8 +726,8 @@ def download_stack(
     checksum_map: Dict[str, str] = {}
     if checksums and checksums.exists():
         try:
-            data = json.loads(checksums.read_text())
-        except json.JSONDecodeError:
+            data = jsonio.loads(checksums.read_bytes())
+        except jsonio.JSONDecodeError:
             import yaml
 
             data = yaml.safe_load(checksums.read_text())
@@ -362,6 +752,7 @@ def evaluate(
     recorder_jar: Optional[pathlib.Path] = typer.Option(None, help="Path to robocode-tankroyale-recorder jar"),
     baseline_manifest: pathlib.Path = typer.Option(pathlib.Path("baselines/manifest.yaml"), help="Baseline manifest (not shared with models)"),
     java_bin: Optional[pathlib.Path] = typer.Option(None, help="Path to java binary (defaults to JAVA_BIN env or Homebrew openjdk@17)"),
+    concurrency: int = typer.Option(1, min=1, help="Matches to run at once; each runs its own server and bots, so keep it within physical cores (SPEC.md §13)"),
 ) -> None:
     """
     Run the full benchmark loop for a prepared variant workspace.
@@ -408,46 +799,45 @@ def evaluate(
         raise typer.Exit(1)
 
     # Discover bot names from configs
-    def _bot_name(bot_dir: pathlib.Path) -> str:
-        cfg_path = bot_dir / "bot-config.json"
-        if cfg_path.exists():
-            try:
-                return json.loads(cfg_path.read_text()).get("name", bot_dir.name)
-            except Exception:
-                return bot_dir.name
-        return bot_dir.name
-
     model_bot_name = _bot_name(paths.bot)
 
     per_baseline: Dict[str, MatchMetrics] = {}
     ffa_rounds: List[RoundScore] = []
+    common = {
+        "server_jar": server_path,
+        "recorder_jar": recorder_path,
+        "logs_dir": paths.logs,
+        "recorder_dir": paths.results,
+        "java_bin": java_bin,
+        "timeout_seconds": cfg.resource_limits.match_timeout_seconds,
+    }
+    # Every match is planned up front; _run_matches returns results in this order, so the
+    # aggregation below is the same regardless of concurrency.
+    matches: List[dict] = []
+    # (baseline id or None for melee, participants, rounds per match) for each planned match.
+    plan: List[tuple[Optional[str], int, int]] = []
+
+    # Baseline lobby names are looked up once, not per seed.
+    baselines = [(base, _bot_name(base.path)) for base in manifest.bots]
 
     # 1v1 bracket: model vs each baseline for all seeds.
-    for base in manifest.bots:
+    for base, base_name in baselines:
         if "1v1" not in base.game_types:
             continue
-        rounds: List[RoundScore] = []
         game_setup = _battle_setup_from_config(battle_config, "1v1", participants=2)
+        expected = [model_bot_name, base_name]
         for seed in seeds:
-            port = _find_free_port(0)
-            results = _launch_battle(
-                server_jar=server_path,
-                recorder_jar=recorder_path,
-                expected=[model_bot_name, _bot_name(base.path)],
-                bot_dirs=[paths.bot, base.path],
-                game_setup=game_setup,
-                seed=seed,
-                logs_dir=paths.logs,
-                recorder_dir=paths.results,
-                java_bin=java_bin,
-                port=port,
-                timeout_seconds=cfg.resource_limits.match_timeout_seconds,
+            matches.append(
+                dict(
+                    common,
+                    expected=expected,
+                    bot_dirs=[paths.bot, base.path],
+                    game_setup=game_setup,
+                    seed=seed,
+                    match_id=f"1v1_{base.id}_seed{seed}",
+                )
             )
-            round_map = _results_to_roundscores(results, participants=2, rounds=game_setup["numberOfRounds"])
-            for entry in round_map.get(model_bot_name, []):
-                rounds.append(RoundScore(**entry))
-        if rounds:
-            per_baseline[base.id] = MatchMetrics(rounds=rounds)
+            plan.append((base.id, 2, game_setup["numberOfRounds"]))
 
     # Melee/Classic bracket
     melee_participants = max(2, manifest.melee_participants)
@@ -456,28 +846,54 @@ def evaluate(
         # Cycle baselines to fill slots (excluding model).
         from itertools import cycle, islice
 
-        baseline_cycle = cycle(manifest.bots)
+        baseline_cycle = cycle(baselines)
         for seed in seeds:
-            port = _find_free_port(0)
             opponents = list(islice(baseline_cycle, melee_participants - 1))
-            expected_names = [model_bot_name] + [_bot_name(op.path) for op in opponents]
-            bot_dirs = [paths.bot] + [op.path for op in opponents]
-            results = _launch_battle(
-                server_jar=server_path,
-                recorder_jar=recorder_path,
-                expected=expected_names,
-                bot_dirs=bot_dirs,
-                game_setup=game_setup,
-                seed=seed,
-                logs_dir=paths.logs,
-                recorder_dir=paths.results,
-                java_bin=java_bin,
-                port=port,
-                timeout_seconds=cfg.resource_limits.match_timeout_seconds,
+            expected_names = [model_bot_name] + [name for _, name in opponents]
+            bot_dirs = [paths.bot] + [op.path for op, _ in opponents]
+            matches.append(
+                dict(
+                    common,
+                    expected=expected_names,
+                    bot_dirs=bot_dirs,
+                    game_setup=game_setup,
+                    seed=seed,
+                    match_id=f"melee_seed{seed}",
+                )
             )
-            round_map = _results_to_roundscores(results, participants=melee_participants, rounds=game_setup["numberOfRounds"])
-            for entry in round_map.get(model_bot_name, []):
-                ffa_rounds.append(RoundScore(**entry))
+            plan.append((None, melee_participants, game_setup["numberOfRounds"]))
+
+    # Raw results are appended as each match finishes so an aborted run keeps what completed.
+    paths.results.mkdir(parents=True, exist_ok=True)
+    with (paths.results / "matches.ndjson").open("wb") as ndjson:
+
+        def _write(index: int, **fields) -> None:
+            record = {
+                "match_id": matches[index]["match_id"],
+                "baseline": plan[index][0],
+                "seed": matches[index]["seed"],
+                **fields,
+            }
+            ndjson.write(jsonio.dumps_bytes(record) + b"\n")
+            ndjson.flush()
+
+        def _record(index: int, results: list[dict]) -> None:
+            _write(index, results=results)
+
+        def _record_error(index: int, exc: Exception) -> None:
+            _write(index, error=f"{type(exc).__name__}: {exc}")
+
+        all_results = _run_async(_run_matches(matches, concurrency, on_result=_record, on_error=_record_error))
+
+    per_baseline_rounds: Dict[str, List[RoundScore]] = {}
+    for (baseline_id, participants, n_rounds), results in zip(plan, all_results):
+        round_map = _results_to_roundscores(results, participants=participants, rounds=n_rounds)
+        target = ffa_rounds if baseline_id is None else per_baseline_rounds.setdefault(baseline_id, [])
+        for entry in round_map.get(model_bot_name, []):
+            target.append(RoundScore(**entry))
+    for baseline_id, rounds in per_baseline_rounds.items():
+        if rounds:
+            per_baseline[baseline_id] = MatchMetrics(rounds=rounds)
 
     # Aggregate scoring
     avg_totals = [m.avg_total_score for m in per_baseline.values()] if per_baseline else []
@@ -506,7 +922,7 @@ def evaluate(
     }
     results_path = paths.results / "metrics.json"
     results_path.parent.mkdir(parents=True, exist_ok=True)
-    results_path.write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    results_path.write_bytes(jsonio.dumps_bytes(metrics, indent=True))
     print(f"[green]Evaluation complete[/green]. Results: {results_path}")
 
 
@@ -519,6 +935,7 @@ def save_artifact(
     benchmark_config: pathlib.Path = typer.Option(pathlib.Path("benchmark-config.yaml"), help="Benchmark config used for scoring"),
     template_dir: pathlib.Path = typer.Option(pathlib.Path("bot_template"), help="Template directory to hash for provenance"),
     force: bool = typer.Option(False, help="Overwrite existing artifact directory if present"),
+    hardlinks: bool = typer.Option(False, help="Hardlink files instead of copying (artifact then shares inodes with the workspace)"),
 ) -> None:
     """Copy bot + prompt traces into bots/<model>/<variant>/ with metadata."""
     try:
@@ -530,6 +947,7 @@ def save_artifact(
             benchmark_config=benchmark_config,
             template_dir=template_dir,
             force=force,
+            use_hardlinks=hardlinks,
         )
     except ArtifactError as exc:
         print(f"[red]Artifact save failed[/red]: {exc}")
@@ -3,10 +3,12 @@ from __future__ import annotations
 import math
 import statistics
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, Iterable, List, Sequence
 
 
-@dataclass
+# slots: scoring objects are small and numerous, so skip the per-instance __dict__.
+@dataclass(slots=True)
 class RoundScore:
     round_number: int
     total_score: float
@@ -20,7 +22,10 @@ class RoundScore:
     crashed_or_disqualified: bool = False
 
 
-@dataclass
+_ROUND_COLUMNS = attrgetter("total_score", "rank", "survival_score", "bullet_damage", "ram_damage")
+
+
+@dataclass(slots=True)
 class MatchMetrics:
     rounds: List[RoundScore]
     avg_total_score: float = field(init=False)
@@ -34,15 +39,17 @@ class MatchMetrics:
         if not self.rounds:
             raise ValueError("MatchMetrics requires at least one round")
         n = len(self.rounds)
-        self.avg_total_score = sum(r.total_score for r in self.rounds) / n
-        self.avg_rank = sum(r.rank for r in self.rounds) / n
-        self.winrate_round = sum(1 for r in self.rounds if r.rank == 1) / n
-        self.avg_survival_score = sum(r.survival_score for r in self.rounds) / n
-        self.avg_bullet_damage = sum(r.bullet_damage for r in self.rounds) / n
-        self.avg_ram_damage = sum(r.ram_damage for r in self.rounds) / n
+        # One pass over the rounds into columns; sum() per column keeps the averages exact.
+        totals, ranks, survival, bullet, ram = zip(*map(_ROUND_COLUMNS, self.rounds))
+        self.avg_total_score = sum(totals) / n
+        self.avg_rank = sum(ranks) / n
+        self.winrate_round = ranks.count(1) / n
+        self.avg_survival_score = sum(survival) / n
+        self.avg_bullet_damage = sum(bullet) / n
+        self.avg_ram_damage = sum(ram) / n
 
 
-@dataclass
+@dataclass(slots=True)
 class BotAggregate:
     match_metrics: Dict[str, MatchMetrics]
 
@@ -61,7 +68,7 @@ class BotAggregate:
         return statistics.pvariance(values)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreWeights:
     w_bps: float = 0.5
     w_fps: float = 0.3
@@ -69,7 +76,7 @@ class ScoreWeights:
     alpha_winrate: float = 0.7
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalScore:
     bps: float
     fps: float
@@ -101,7 +108,11 @@ def compute_fps(ffa_rounds: Iterable[RoundScore], participants: int) -> float:
     rounds = list(ffa_rounds)
     if not rounds:
         return 0.0
-    return sum(rank_score(r.rank, participants) for r in rounds) / len(rounds)
+    if participants <= 1:
+        return 1.0
+    # rank_score inlined; each term is still divided on its own so the sum matches exactly.
+    denom = participants - 1
+    return sum((participants - r.rank) / denom for r in rounds) / len(rounds)
 
 
 def compute_srs(bot: BotAggregate, variance_normalizer: float = 1.0) -> float:
@@ -134,8 +145,8 @@ def normalize_scores(values: Sequence[float], clamp: bool = True) -> List[float]
     high = max(values)
     if math.isclose(low, high):
         return [0.0 for _ in values]
-    normed = [(v - low) / (high - low) for v in values]
+    span = high - low
     if clamp:
-        normed = [min(max(v, 0.0), 1.0) for v in normed]
-    return normed
+        return [min(max((v - low) / span, 0.0), 1.0) for v in values]
+    return [(v - low) / span for v in values]
 
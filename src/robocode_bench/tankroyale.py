@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import datetime
 import os
 import pathlib
 import socket
@@ -8,6 +7,7 @@ import subprocess
 import time
 import urllib.request
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable, Optional
 
@@ -15,7 +15,8 @@ DEFAULT_PORT = 7654
 MAVEN_BASE = "https://repo1.maven.org/maven2/dev/robocode/tankroyale"
 
 
-@dataclass
+# A live process handle: compare by identity, no per-instance __dict__.
+@dataclass(slots=True, eq=False)
 class TankRoyaleProcess:
     name: str
     process: subprocess.Popen
@@ -35,10 +36,15 @@ def artifact_url(artifact: str, version: str) -> str:
     return f"{MAVEN_BASE}/{artifact}/{version}/{jar}"
 
 
+_DOWNLOAD_CHUNK = 1 << 20
+
+
 def _sha256(path: pathlib.Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(_DOWNLOAD_CHUNK), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -53,34 +59,51 @@ def download_artifact(artifact: str, version: str, dest_dir: pathlib.Path, expec
             raise ValueError(f"Checksum mismatch for existing {target}")
         return target
     url = artifact_url(artifact, version)
-    with urllib.request.urlopen(url) as resp, target.open("wb") as fh:  # type: ignore[arg-type]
-        fh.write(resp.read())
-    if expected:
-        actual = _sha256(target)
-        if actual != expected:
-            target.unlink(missing_ok=True)
+    # Stream to a .part file, hashing each chunk as it is written; the jar only appears
+    # under its final name once complete (and verified, when a checksum is known).
+    partial = target.with_name(target.name + ".part")
+    h = hashlib.sha256()
+    try:
+        with urllib.request.urlopen(url) as resp, partial.open("wb") as fh:  # type: ignore[arg-type]
+            for chunk in iter(lambda: resp.read(_DOWNLOAD_CHUNK), b""):
+                h.update(chunk)
+                fh.write(chunk)
+        actual = h.hexdigest()
+        if expected and actual != expected:
             raise ValueError(f"Checksum mismatch for {target} (expected {expected}, got {actual})")
+        os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
     return target
 
 
 def download_stack(server: str, recorder: str, gui: str, dest_dir: pathlib.Path, checksums: dict[str, str] | None = None) -> dict[str, pathlib.Path]:
     checksums = checksums or {}
-    artifacts = {
-        "server": download_artifact("robocode-tankroyale-server", server, dest_dir, checksums.get("server")),
-        "recorder": download_artifact("robocode-tankroyale-recorder", recorder, dest_dir, checksums.get("recorder")),
-        "gui": download_artifact("robocode-tankroyale-gui", gui, dest_dir, checksums.get("gui")),
+    wanted = {
+        "server": ("robocode-tankroyale-server", server),
+        "recorder": ("robocode-tankroyale-recorder", recorder),
+        "gui": ("robocode-tankroyale-gui", gui),
     }
-    return artifacts
+    # Downloads are network-bound and write distinct files, so fetch them concurrently.
+    with ThreadPoolExecutor(max_workers=len(wanted)) as pool:
+        futures = {
+            key: pool.submit(download_artifact, artifact, version, dest_dir, checksums.get(key))
+            for key, (artifact, version) in wanted.items()
+        }
+        return {key: fut.result() for key, fut in futures.items()}
 
 
 def wait_for_port(host: str = "127.0.0.1", port: int = DEFAULT_PORT, timeout: float = 10.0) -> bool:
-    end = datetime.datetime.now().timestamp() + timeout
-    while datetime.datetime.now().timestamp() < end:
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
         try:
-            with socket.create_connection((host, port), timeout=1):
+            with socket.create_connection((host, port), timeout=0.5):
                 return True
         except OSError:
-            time.sleep(0.1)
+            # Back off from 10ms so a fast-starting server is picked up quickly.
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
     return False
 
 
@@ -105,7 +128,8 @@ def start_server(
     if enable_initial_position:
         cmd.append("--enable-initial-position")
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("w", encoding="utf-8") as fh:
+    # Binary: the child writes bytes straight into the fd, no text layer needed here.
+    with log_path.open("wb") as fh:
         proc = subprocess.Popen(cmd, stdout=fh, stderr=subprocess.STDOUT)
     return TankRoyaleProcess(name="server", process=proc, log_path=log_path)
 
@@ -131,6 +155,6 @@ def start_recorder(
         output_dir.mkdir(parents=True, exist_ok=True)
         cmd.append(f"--dir={output_dir}")
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("w", encoding="utf-8") as fh:
+    with log_path.open("wb") as fh:
         proc = subprocess.Popen(cmd, stdout=fh, stderr=subprocess.STDOUT)
     return TankRoyaleProcess(name="recorder", process=proc, log_path=log_path)
@@ -8,6 +8,9 @@ import pathlib
 from dataclasses import dataclass
 from typing import Optional
 
+from . import jsonio
+from .artifacts import clone_file
+
 
 @dataclass
 class WorkspacePaths:
@@ -21,11 +24,34 @@ class WorkspacePaths:
     shared_docs: pathlib.Path | None = None
 
 
+_LINK_MODES = ("reflink", "copy")
+
+
+def _reflink_or_copy(src: str, dst: str) -> str:
+    """copy2, but let the kernel clone or copy the data (reflink/copy_file_range) when it can."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        cloned = clone_file(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+    if not cloned:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 class WorkspaceManager:
-    """Create and manage benchmark workspaces following SPEC.md layout."""
+    """
+    Create and manage benchmark workspaces following SPEC.md layout.
+
+    link_mode controls how template files land in a workspace: "reflink" (default) shares
+    extents copy-on-write where the filesystem supports it and copies otherwise; "copy"
+    always copies bytes. Both leave the template untouched when workspace files are edited.
+    """
 
-    def __init__(self, base_dir: pathlib.Path):
+    def __init__(self, base_dir: pathlib.Path, link_mode: str = "reflink"):
+        if link_mode not in _LINK_MODES:
+            raise ValueError(f"link_mode must be one of {_LINK_MODES}, got {link_mode!r}")
         self.base_dir = base_dir
+        self.link_mode = link_mode
+        self._copy_file = {"reflink": _reflink_or_copy, "copy": shutil.copy2}[link_mode]
 
     def create(
         self,
@@ -61,12 +87,14 @@ class WorkspaceManager:
         )
 
     def _copy_template(self, template_dir: pathlib.Path, dest: pathlib.Path, seed: str) -> None:
-        for item in template_dir.iterdir():
-            dest_item = dest / item.name
-            if item.is_dir():
-                shutil.copytree(item, dest_item, dirs_exist_ok=True)
-            else:
-                shutil.copy2(item, dest_item)
+        # scandir entries carry the file type, so only symlinks need an extra stat.
+        with os.scandir(template_dir) as it:
+            for entry in it:
+                dest_item = os.path.join(dest, entry.name)
+                if entry.is_dir():
+                    shutil.copytree(entry.path, dest_item, copy_function=self._copy_file, dirs_exist_ok=True)
+                else:
+                    self._copy_file(entry.path, dest_item)
         self._apply_random_appearance(dest / "bot-config.json", seed)
 
     def _copy_shared_docs(self, items: list[pathlib.Path], dest_dir: pathlib.Path) -> None:
@@ -75,9 +103,9 @@ class WorkspaceManager:
             src = item.resolve()
             target = dest_dir / src.name
             if src.is_dir():
-                shutil.copytree(src, target, dirs_exist_ok=True)
+                shutil.copytree(src, target, copy_function=self._copy_file, dirs_exist_ok=True)
             else:
-                shutil.copy2(src, target)
+                self._copy_file(str(src), str(target))
 
     @staticmethod
     def write_prompt(paths: WorkspacePaths, name: str, content: str) -> pathlib.Path:
@@ -95,7 +123,7 @@ class WorkspaceManager:
     @staticmethod
     def write_results(paths: WorkspacePaths, name: str, payload: dict) -> pathlib.Path:
         target = paths.results / f"{name}.json"
-        target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        target.write_bytes(jsonio.dumps_bytes(payload, indent=True))
         return target
 
     @staticmethod
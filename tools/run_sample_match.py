@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import pathlib
 import signal
 import subprocess
 import sys
+import time
+from types import MappingProxyType
 from typing import List
 
+import websockets
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from robocode_bench import tankroyale
+from robocode_bench import jsonio, tankroyale
 
 BOT_NAMES = [name.strip() for name in os.environ.get("BOTS", "rammer,spinner").split(",") if name.strip()]
 JAVA_BIN_PATH = pathlib.Path("/opt/homebrew/opt/openjdk@17/bin/java")
@@ -24,60 +29,62 @@ TOOLS_BIN = ROOT / "tools" / "bin"
 SERVER_JAR = TOOLS_BIN / "robocode-tankroyale-server-0.34.1.jar"
 RECORDER_JAR = TOOLS_BIN / "robocode-tankroyale-recorder-0.34.1.jar"
 PORT = 7654
+GAME_ENDED = "GameEndedEventForObserver"
+GAME_ENDED_B = GAME_ENDED.encode()
+
+# Used when the server handshake carries no gameSetup; maxNumberOfParticipants is set per match.
+DEFAULT_GAME_SETUP = MappingProxyType({
+    "gameType": "classic",
+    "arenaWidth": 800,
+    "isArenaWidthLocked": True,
+    "arenaHeight": 600,
+    "isArenaHeightLocked": True,
+    "minNumberOfParticipants": 2,
+    "isMinNumberOfParticipantsLocked": False,
+    "maxNumberOfParticipants": 2,
+    "isMaxNumberOfParticipantsLocked": False,
+    "numberOfRounds": 1,
+    "isNumberOfRoundsLocked": False,
+    "gunCoolingRate": 0.1,
+    "isGunCoolingRateLocked": False,
+    "maxInactivityTurns": 450,
+    "isMaxInactivityTurnsLocked": False,
+    "turnTimeout": 40,
+    "isTurnTimeoutLocked": False,
+    "readyTimeout": 10000,
+    "isReadyTimeoutLocked": False,
+    "defaultTurnsPerSecond": 240,
+})
+CONTROLLER_HANDSHAKE = MappingProxyType({
+    "type": "ControllerHandshake",
+    "name": "bench-controller",
+    "version": "0.1",
+    "author": "bench",
+})
 
 
 async def controller_run(expected_bots: List[str]) -> list[dict]:
-    import websockets
-    import json
-
     url = f"ws://localhost:{PORT}"
     async with websockets.connect(url) as ws:
-        msg = json.loads(await ws.recv())
+        msg = jsonio.loads(await ws.recv())
         assert msg.get("type") == "ServerHandshake", f"Unexpected message: {msg}"
         server_session = msg["sessionId"]
         game_setup = msg.get("gameSetup")
-        ctrl = {
-            "type": "ControllerHandshake",
-            "sessionId": server_session,
-            "name": "bench-controller",
-            "version": "0.1",
-            "author": "bench",
-        }
-        await ws.send(json.dumps(ctrl))
+        await ws.send(jsonio.dumps({**CONTROLLER_HANDSHAKE, "sessionId": server_session}))
 
+        # Only expected bots count towards the lobby; keep just the address of each.
+        expected_set = set(expected_bots)
         bots: dict[str, dict] = {}
-        while len(bots) < len(expected_bots):
-            payload = json.loads(await ws.recv())
+        while len(bots) < len(expected_set):
+            payload = jsonio.loads(await ws.recv())
             if payload.get("type") == "BotListUpdate":
                 for bot in payload.get("bots", []):
-                    bots[bot["name"]] = bot
-        missing = [name for name in expected_bots if name not in bots]
-        if missing:
-            raise RuntimeError(f"Missing bots in lobby: {missing}")
-        addresses = [{"host": bots[name]["host"], "port": bots[name]["port"]} for name in expected_bots]
+                    name = bot["name"]
+                    if name in expected_set and name not in bots:
+                        bots[name] = {"host": bot["host"], "port": bot["port"]}
+        addresses = [bots[name] for name in expected_bots]
         if not game_setup:
-            game_setup = {
-                "gameType": "classic",
-                "arenaWidth": 800,
-                "isArenaWidthLocked": True,
-                "arenaHeight": 600,
-                "isArenaHeightLocked": True,
-                "minNumberOfParticipants": 2,
-                "isMinNumberOfParticipantsLocked": False,
-                "maxNumberOfParticipants": len(expected_bots),
-                "isMaxNumberOfParticipantsLocked": False,
-                "numberOfRounds": 1,
-                "isNumberOfRoundsLocked": False,
-                "gunCoolingRate": 0.1,
-                "isGunCoolingRateLocked": False,
-                "maxInactivityTurns": 450,
-                "isMaxInactivityTurnsLocked": False,
-                "turnTimeout": 40,
-                "isTurnTimeoutLocked": False,
-                "readyTimeout": 10000,
-                "isReadyTimeoutLocked": False,
-                "defaultTurnsPerSecond": 240,
-            }
+            game_setup = dict(DEFAULT_GAME_SETUP, maxNumberOfParticipants=len(expected_bots))
         else:
             game_setup = dict(game_setup)
             game_setup["numberOfRounds"] = 1
@@ -87,15 +94,19 @@ async def controller_run(expected_bots: List[str]) -> list[dict]:
             "botAddresses": addresses,
             "gameSetup": game_setup,
         }
-        await ws.send(json.dumps(start_game))
+        await ws.send(jsonio.dumps(start_game))
 
         game_results: list[dict] | None = None
         while True:
             try:
-                payload = json.loads(await ws.recv())
+                frame = await ws.recv()
             except websockets.ConnectionClosed:
                 break
-            if payload.get("type") == "GameEndedEventForObserver":
+            # Tick events arrive every turn; only decode frames that can be the game-end event.
+            if (GAME_ENDED_B if isinstance(frame, bytes) else GAME_ENDED) not in frame:
+                continue
+            payload = jsonio.loads(frame)
+            if payload.get("type") == GAME_ENDED:
                 game_results = payload.get("results", [])
                 break
         return game_results or []
@@ -108,10 +119,15 @@ def launch_bot(path: pathlib.Path) -> subprocess.Popen:
     return subprocess.Popen(["python", "main.py"], cwd=path, env=env)
 
 
-def bot_name_from_config(bot_dir: pathlib.Path) -> str:
-    import json
+@functools.lru_cache(maxsize=None)
+def _read_bot_config(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns is part of the key so an edited config is re-read.
+    return jsonio.loads(pathlib.Path(path_str).read_bytes())
+
 
-    cfg = json.loads((bot_dir / "bot-config.json").read_text())
+def bot_name_from_config(bot_dir: pathlib.Path) -> str:
+    cfg_path = bot_dir / "bot-config.json"
+    cfg = _read_bot_config(str(cfg_path), cfg_path.stat().st_mtime_ns)
     return cfg.get("name", bot_dir.name)
 
 
@@ -139,11 +155,16 @@ def main() -> None:
         try:
             results = asyncio.run(asyncio.wait_for(controller_run(expected_names), timeout=60))
         finally:
+            # One shared 10s deadline for all bots, then SIGTERM whatever is left.
+            deadline = time.monotonic() + 10
+            lingering = []
             for p in bots:
                 try:
-                    p.wait(timeout=10)
+                    p.wait(timeout=max(0.0, deadline - time.monotonic()))
                 except subprocess.TimeoutExpired:
-                    p.send_signal(signal.SIGTERM)
+                    lingering.append(p)
+            for p in lingering:
+                p.send_signal(signal.SIGTERM)
         print("Results:")
         for r in results:
             print(
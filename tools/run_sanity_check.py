@@ -2,105 +2,195 @@
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures
+import functools
+import hashlib
+import os
 import pathlib
 import sys
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from robocode_bench import orchestrator  # type: ignore
-from robocode_bench.config import BenchmarkConfig
+from robocode_bench import jsonio  # type: ignore
 
+# orchestrator (typer, rich, pydantic) and friends are imported inside the checks that use
+# them, so --help and argument errors return without paying for those imports.
+if TYPE_CHECKING:
+    from robocode_bench import orchestrator
 
-def _bot_name(bot_dir: pathlib.Path) -> str:
-    cfg_path = bot_dir / "bot-config.json"
-    if cfg_path.exists():
-        try:
-            data = json.loads(cfg_path.read_text())
-            if isinstance(data, dict):
-                return str(data.get("name", bot_dir.name))
-        except Exception:
-            pass
-    return bot_dir.name
-
-
-def _validate_config(bot_dir: pathlib.Path) -> Tuple[list[str], dict]:
-    cfg_path = bot_dir / "bot-config.json"
+
+# Kept ordered (not a set) so config errors are always reported in the same order.
+_REQUIRED_FIELDS = ("name", "version", "authors", "description", "gameTypes", "countryCodes")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_bot_config(bot_dir_str: str) -> Tuple[str, Tuple[str, ...], dict]:
+    """Read and parse <bot_dir>/bot-config.json once: (lobby name, config errors, parsed data)."""
+    cfg_path = os.path.join(bot_dir_str, "bot-config.json")
     errors: list[str] = []
     data: dict = {}
     try:
-        raw = cfg_path.read_text()
-        data = json.loads(raw)
+        with open(cfg_path, "rb") as fh:
+            parsed = jsonio.loads(fh.read())
     except FileNotFoundError:
         errors.append("bot-config.json missing")
-    except json.JSONDecodeError as exc:
+    except OSError as exc:
+        errors.append(f"bot-config.json unreadable: {exc}")
+    except (jsonio.JSONDecodeError, UnicodeDecodeError) as exc:
         errors.append(f"bot-config.json invalid JSON: {exc}")
     else:
-        required = ["name", "version", "authors", "description", "gameTypes", "countryCodes"]
-        for key in required:
-            if not data.get(key):
-                errors.append(f"Missing or empty required field '{key}'")
-    return errors, data
+        if isinstance(parsed, dict):
+            data = parsed
+            errors.extend(f"Missing or empty required field '{key}'" for key in _REQUIRED_FIELDS if not data.get(key))
+        else:
+            errors.append("bot-config.json must contain a JSON object")
+    return str(data.get("name", os.path.basename(bot_dir_str))), tuple(errors), data
+
+
+def _bot_name(bot_dir: pathlib.Path) -> str:
+    return _load_bot_config(os.path.abspath(bot_dir))[0]
+
+
+def _validate_config(bot_dir: pathlib.Path, fast_fail: bool = False) -> Tuple[list[str], dict]:
+    """Config errors and parsed data; fast_fail reports only the first error."""
+    _, errors, data = _load_bot_config(os.path.abspath(bot_dir))
+    return list(errors[:1] if fast_fail else errors), data
+
+
+def _write_if_changed(path: pathlib.Path, payload: bytes) -> None:
+    """Write payload unless the file already holds exactly these bytes (keeps its mtime stable)."""
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    path.write_bytes(payload)
+
+
+_made_dirs: set[str] = set()
+
+
+def _ensure_dirs(*paths: pathlib.Path) -> None:
+    """makedirs each path once per process (--check all asks for results/ from several checks)."""
+    for path in paths:
+        key = os.fspath(path)
+        if key not in _made_dirs:
+            os.makedirs(key, exist_ok=True)
+            _made_dirs.add(key)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(path_str: str) -> pathlib.Path:
+    # Jar paths repeat across run_match calls; walk their symlink chain once per process.
+    # Also the argparse type for path options, so main() does not resolve them again.
+    return pathlib.Path(path_str).resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _opponents() -> dict[str, pathlib.Path]:
+    """Sample bot directories by name, listed once per process."""
+    try:
+        with os.scandir(ROOT / "sample_bots") as it:
+            return {e.name: pathlib.Path(e.path) for e in it if e.is_dir()}
+    except FileNotFoundError:
+        return {}
+
+
+def _compile_marker(paths: orchestrator.WorkspacePaths) -> pathlib.Path:
+    return paths.root / "results" / ".compile_ok"
+
+
+def _source_fingerprint(bot_src: pathlib.Path) -> str:
+    """Digest of every bot source's (path, mtime_ns, size) plus the interpreter version."""
+    from robocode_bench.artifacts import directory_fingerprint
 
+    return hashlib.sha256(repr((sys.version, directory_fingerprint(bot_src))).encode()).hexdigest()
+
+
+def run_static(workspace: pathlib.Path, fast_fail: bool = False) -> str:
+    from robocode_bench import orchestrator
 
-def run_static(workspace: pathlib.Path) -> str:
     paths = orchestrator._workspace_paths(workspace)
     log_dir = paths.root / "logs" / "sanity"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    result = orchestrator._run_py_compile(paths.bot_src)
-    cfg_errors, cfg_data = _validate_config(paths.bot)
+    summary_path = paths.root / "results" / "sanity_static.json"
+    _ensure_dirs(log_dir, summary_path.parent)
+    # The config check is cheap, so it runs first; with fast_fail a broken config stops here.
+    cfg_errors, cfg_data = _validate_config(paths.bot, fast_fail=fast_fail)
     log_path = log_dir / "static.log"
-    log_path.write_text((result.stdout or "") + (result.stderr or ""), encoding="utf-8")
+    if fast_fail and cfg_errors:
+        result = None
+        log_path.write_text("py_compile skipped (--fast-fail): bot-config.json check failed\n", encoding="utf-8")
+    else:
+        result = orchestrator._run_py_compile(paths.bot_src)
+        log_path.write_text((result.stdout or "") + (result.stderr or ""), encoding="utf-8")
     summary = {
         "check": "static",
-        "status": "ok" if result.returncode == 0 and not cfg_errors else "failed",
-        "py_compile_exit": result.returncode,
+        "status": "ok" if result is not None and result.returncode == 0 and not cfg_errors else "failed",
+        "py_compile_exit": result.returncode if result is not None else None,
         "config_errors": cfg_errors,
         "bot_config": cfg_data,
         "log": str(log_path),
     }
-    summary_path = paths.root / "results" / "sanity_static.json"
-    summary_path.parent.mkdir(parents=True, exist_ok=True)
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    _write_if_changed(summary_path, jsonio.dumps_bytes(summary, indent=True))
+    # Lets run_match skip recompiling sources that have not changed since this check.
+    marker = _compile_marker(paths)
+    if result is None:
+        pass  # not compiled this time; the marker's fingerprint still says what it covers
+    elif result.returncode == 0:
+        marker.write_text(_source_fingerprint(paths.bot_src), encoding="utf-8")
+    else:
+        marker.unlink(missing_ok=True)
     if summary["status"] != "ok":
         raise SystemExit(f"Static check failed; see {log_path}")
     print(f"[static] ok -> logs: {log_path}")
     return str(summary_path)
 
 
-def run_match(workspace: pathlib.Path, opponent: str, rounds: int, seed: int | None, server_jar: pathlib.Path | None, recorder_jar: pathlib.Path | None, java_bin: pathlib.Path | None) -> str:
-    cfg = BenchmarkConfig.load(pathlib.Path("benchmark-config.yaml"))
+def run_match(workspace: pathlib.Path, opponent: str, rounds: int, seed: int | None, server_jar: pathlib.Path | None, recorder_jar: pathlib.Path | None, java_bin: pathlib.Path | None, port: int | None = None) -> str:
+    from robocode_bench import orchestrator
+    from robocode_bench.config import load_config_cached
+
+    cfg = load_config_cached(pathlib.Path("benchmark-config.yaml"))
     paths = orchestrator._workspace_paths(workspace)
     defaults = orchestrator._default_stack_paths(cfg)
-    server_path = pathlib.Path(server_jar or defaults["server"]).resolve()
-    recorder_path = pathlib.Path(recorder_jar).resolve() if recorder_jar else None
+    # CLI jar paths arrive resolved (argparse type=_resolve).
+    server_path = server_jar or _resolve(str(defaults["server"]))
+    recorder_path = recorder_jar
     java_bin = java_bin or orchestrator._default_java_bin()
     if not server_path.exists():
         raise SystemExit(f"Server jar not found: {server_path}")
     if recorder_path and not recorder_path.exists():
         raise SystemExit(f"Recorder jar not found: {recorder_path}")
 
-    opp_dir = ROOT / "sample_bots" / opponent
-    if not opp_dir.exists():
-        raise SystemExit(f"Unknown opponent '{opponent}'. Expected directory: {opp_dir}")
+    opp_dir = _opponents().get(opponent)
+    if opp_dir is None:
+        raise SystemExit(f"Unknown opponent '{opponent}'. Expected directory: {ROOT / 'sample_bots' / opponent}")
 
-    # Ensure code compiles before launching the battle.
-    build = orchestrator._run_py_compile(paths.bot_src)
-    if build.returncode != 0:
-        raise SystemExit("py_compile failed; run the static check and fix errors before running matches.")
+    # Ensure code compiles before launching the battle (unless the static check already
+    # compiled these exact sources).
+    marker = _compile_marker(paths)
+    try:
+        compiled_ok = marker.read_text(encoding="utf-8") == _source_fingerprint(paths.bot_src)
+    except OSError:
+        compiled_ok = False
+    if not compiled_ok:
+        build = orchestrator._run_py_compile(paths.bot_src)
+        if build.returncode != 0:
+            raise SystemExit("py_compile failed; run the static check and fix errors before running matches.")
 
     battle_config = orchestrator._load_battle_config(cfg)
     game_setup = orchestrator._battle_setup_from_config(battle_config, game_type="1v1", participants=2)
     game_setup["numberOfRounds"] = rounds
     seed_to_use = seed if seed is not None else (cfg.seeds[0] if cfg.seeds else 1)
 
-    port = orchestrator._find_free_port(0)
+    port = port or orchestrator._find_free_port(0)
     logs_dir = paths.root / "logs" / "sanity" / opponent
-    logs_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = paths.root / "results" / f"sanity_{opponent}.json"
+    _ensure_dirs(logs_dir, summary_path.parent)
 
     model_name = _bot_name(paths.bot)
     opponent_name = _bot_name(opp_dir)
@@ -118,9 +208,8 @@ def run_match(workspace: pathlib.Path, opponent: str, rounds: int, seed: int | N
         timeout_seconds=180,
     )
 
-    # Winner is highest totalScore.
-    ordering = sorted(results, key=lambda r: r.get("totalScore", 0), reverse=True)
-    winner = ordering[0]["name"] if ordering else None
+    # Winner is highest totalScore (first listed on ties, as with the stable sort this replaces).
+    winner = max(results, key=lambda r: r.get("totalScore", 0))["name"] if results else None
     summary = {
         "check": opponent,
         "status": "ok" if results else "failed",
@@ -130,35 +219,78 @@ def run_match(workspace: pathlib.Path, opponent: str, rounds: int, seed: int | N
         "results": results,
         "logs_dir": str(logs_dir),
     }
-    summary_path = paths.root / "results" / f"sanity_{opponent}.json"
-    summary_path.parent.mkdir(parents=True, exist_ok=True)
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    _write_if_changed(summary_path, jsonio.dumps_bytes(summary, indent=True))
     print(f"[{opponent}] winner={winner} -> logs: {logs_dir}")
     return str(summary_path)
 
 
+MATCH_CHECKS = ("spinner", "serious")
+
+
+def run_all_matches(workspace: pathlib.Path, rounds: int, seed: int | None, server_jar: pathlib.Path | None, recorder_jar: pathlib.Path | None, java_bin: pathlib.Path | None) -> str:
+    """Run every match check concurrently (they mostly wait on the server) and write sanity_all.json."""
+    from robocode_bench import orchestrator
+
+    # Reserved together so the concurrent matches never pick the same server port.
+    ports = orchestrator._reserve_ports(len(MATCH_CHECKS))
+    with concurrent.futures.ThreadPoolExecutor(len(MATCH_CHECKS)) as pool:
+        futures = {
+            opponent: pool.submit(run_match, workspace, opponent, rounds, seed, server_jar, recorder_jar, java_bin, port)
+            for opponent, port in zip(MATCH_CHECKS, ports)
+        }
+        checks = {}
+        for opponent, future in futures.items():
+            try:
+                checks[opponent] = {"status": "ok", "summary": future.result()}
+            except (Exception, SystemExit) as exc:
+                checks[opponent] = {"status": "failed", "error": str(exc)}
+    summary = {
+        "check": "all",
+        "status": "ok" if all(c["status"] == "ok" for c in checks.values()) else "failed",
+        "checks": checks,
+    }
+    summary_path = workspace / "results" / "sanity_all.json"
+    _ensure_dirs(summary_path.parent)
+    _write_if_changed(summary_path, jsonio.dumps_bytes(summary, indent=True))
+    if summary["status"] != "ok":
+        failed = ", ".join(name for name, c in checks.items() if c["status"] != "ok")
+        raise SystemExit(f"Match checks failed ({failed}); see {summary_path}")
+    print(f"[all] ok -> {summary_path}")
+    return str(summary_path)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run lightweight sanity checks for a bot workspace.")
-    parser.add_argument("--workspace", required=True, type=pathlib.Path, help="Path to the variant workspace root (contains bot/)")
+    parser.add_argument("--workspace", required=True, type=_resolve, help="Path to the variant workspace root (contains bot/)")
     parser.add_argument(
         "--check",
         required=True,
-        choices=["static", "spinner", "serious"],
-        help="Which sanity step to run",
+        choices=["static", *MATCH_CHECKS, "all"],
+        help="Which sanity step to run ('all' runs the spinner and serious matches concurrently)",
     )
     parser.add_argument("--rounds", type=int, default=2, help="Number of rounds for spinner/serious matches")
     parser.add_argument("--seed", type=int, default=None, help="Seed for spinner/serious matches (defaults to first benchmark seed)")
-    parser.add_argument("--server-jar", type=pathlib.Path, help="Optional path to server jar")
-    parser.add_argument("--recorder-jar", type=pathlib.Path, help="Optional path to recorder jar")
+    parser.add_argument("--server-jar", type=_resolve, help="Optional path to server jar")
+    parser.add_argument("--recorder-jar", type=_resolve, help="Optional path to recorder jar")
     parser.add_argument("--java-bin", type=pathlib.Path, help="Optional path to java executable")
+    parser.add_argument("--fast-fail", action="store_true", help="Static check: stop at the first bot-config.json problem (reported alone, py_compile skipped)")
     args = parser.parse_args()
 
-    workspace = args.workspace.resolve()
+    workspace = args.workspace
     if not workspace.exists():
         raise SystemExit(f"Workspace does not exist: {workspace}")
 
     if args.check == "static":
-        run_static(workspace)
+        run_static(workspace, fast_fail=args.fast_fail)
+    elif args.check == "all":
+        run_all_matches(
+            workspace=workspace,
+            rounds=args.rounds,
+            seed=args.seed,
+            server_jar=args.server_jar,
+            recorder_jar=args.recorder_jar,
+            java_bin=args.java_bin,
+        )
     else:
         opponent = args.check
         run_match(